@@ -0,0 +1,177 @@
+"""Local stand-in for the parts of the GitHub REST API used by main.py.
+
+Logins encode their repository count: ``bench-2500`` owns 2,500 repositories,
+any other login owns DEFAULT_REPO_COUNT, and logins starting with ``missing``
+return 404. Point the analyser at it with GITHUB_API_BASE.
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import threading
+import time
+
+from flask import Flask, Response, request
+
+DEFAULT_REPO_COUNT = 30
+DEFAULT_RATE_LIMIT = 5000
+LANGUAGES = ["Python", "JavaScript", "Go", "Rust", "C", "TypeScript", None]
+
+
+def repo_count_for(login):
+    prefix, _, suffix = login.rpartition("-")
+    if prefix and suffix.isdigit():
+        return int(suffix)
+    return DEFAULT_REPO_COUNT
+
+
+def build_profile(login):
+    seed = int(hashlib.sha1(login.encode("utf-8")).hexdigest()[:8], 16)
+    return {
+        "login": login,
+        "id": seed,
+        "node_id": f"U_{seed:x}",
+        "avatar_url": f"https://avatars.example.invalid/{login}",
+        "html_url": f"https://github.com/{login}",
+        "type": "User",
+        "site_admin": seed % 17 == 0,
+        "name": login.replace("-", " ").title(),
+        "company": None,
+        "blog": "",
+        "location": "Localhost",
+        "bio": f"Synthetic profile for {login}.",
+        "twitter_username": None,
+        "hireable": None,
+        "public_repos": repo_count_for(login),
+        "public_gists": seed % 25,
+        "followers": seed % 5000,
+        "following": seed % 300,
+        "created_at": f"{2008 + seed % 16}-0{1 + seed % 9}-15T12:00:00Z",
+        "updated_at": "2026-01-01T00:00:00Z",
+    }
+
+
+def build_repo(login, index):
+    return {
+        "id": index,
+        "name": f"{login}-repo-{index}",
+        "full_name": f"{login}/{login}-repo-{index}",
+        "private": False,
+        "html_url": f"https://github.com/{login}/{login}-repo-{index}",
+        "description": f"Synthetic repository number {index}.",
+        "language": LANGUAGES[index % len(LANGUAGES)],
+        "stargazers_count": (index * 7919) % 1000,
+        "forks_count": (index * 104729) % 300,
+        "open_issues_count": index % 40,
+        "updated_at": f"2025-{1 + index % 12:02d}-{1 + index % 28:02d}T00:00:00Z",
+    }
+
+
+def create_app(latency_ms=0, error_rate=0.0, rate_limit=DEFAULT_RATE_LIMIT, seed=None):
+    app = Flask(__name__)
+    rng = random.Random(seed)
+    state = {"remaining": rate_limit, "reset": int(time.time()) + 3600}
+    state_lock = threading.Lock()
+
+    def rate_limit_headers():
+        return {
+            "X-RateLimit-Limit": str(rate_limit),
+            "X-RateLimit-Remaining": str(state["remaining"]),
+            "X-RateLimit-Reset": str(state["reset"]),
+        }
+
+    def json_response(payload, status=200, headers=None):
+        body = json.dumps(payload).encode("utf-8")
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        all_headers = {"ETag": etag, **rate_limit_headers(), **(headers or {})}
+        if status == 200 and request.headers.get("If-None-Match") == etag:
+            return Response(status=304, headers=all_headers)
+        return Response(body, status=status, mimetype="application/json", headers=all_headers)
+
+    @app.before_request
+    def simulate_upstream():
+        if latency_ms:
+            time.sleep(latency_ms / 1000)
+        if request.path == "/rate_limit":
+            return None
+        with state_lock:
+            if time.time() >= state["reset"]:
+                state["remaining"] = rate_limit
+                state["reset"] = int(time.time()) + 3600
+            if state["remaining"] <= 0:
+                return json_response({"message": "API rate limit exceeded"}, status=403)
+            state["remaining"] -= 1
+        if error_rate and rng.random() < error_rate:
+            return json_response({"message": "Server Error"}, status=502)
+        return None
+
+    @app.route("/rate_limit")
+    def rate_limit_status():
+        core = {"limit": rate_limit, "remaining": state["remaining"], "reset": state["reset"]}
+        return json_response({"resources": {"core": core}, "rate": core})
+
+    @app.route("/users/<login>")
+    def user(login):
+        if login.startswith("missing"):
+            return json_response({"message": "Not Found"}, status=404)
+        return json_response(build_profile(login))
+
+    @app.route("/users/<login>/repos")
+    def user_repos(login):
+        if login.startswith("missing"):
+            return json_response({"message": "Not Found"}, status=404)
+        per_page = max(1, min(request.args.get("per_page", 30, type=int), 100))
+        page = max(1, request.args.get("page", 1, type=int))
+        total = repo_count_for(login)
+        start = (page - 1) * per_page
+        items = [build_repo(login, index) for index in range(start, min(start + per_page, total))]
+
+        last_page = max(1, -(-total // per_page))
+        base = f"{request.host_url.rstrip('/')}{request.path}?per_page={per_page}&page="
+        links = []
+        if page < last_page:
+            links.append(f'<{base}{page + 1}>; rel="next"')
+            links.append(f'<{base}{last_page}>; rel="last"')
+        if page > 1:
+            links.append(f'<{base}1>; rel="first"')
+            links.append(f'<{base}{page - 1}>; rel="prev"')
+        return json_response(items, headers={"Link": ", ".join(links)} if links else None)
+
+    @app.route("/users/<login>/orgs")
+    def user_orgs(login):
+        if login.startswith("missing"):
+            return json_response({"message": "Not Found"}, status=404)
+        count = repo_count_for(login) % 5
+        return json_response(
+            [{"login": f"{login}-org-{index}", "avatar_url": "https://avatars.example.invalid/org"} for index in range(count)]
+        )
+
+    @app.route("/search/users")
+    def search_users():
+        query = request.args.get("q", "").split(" ")[0]
+        per_page = max(1, min(request.args.get("per_page", 30, type=int), 100))
+        items = [
+            {"login": f"{query}-{index * 100}", "html_url": f"https://github.com/{query}-{index * 100}"}
+            for index in range(per_page)
+        ]
+        return json_response({"total_count": len(items), "incomplete_results": False, "items": items})
+
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a fake GitHub API for local benchmarking.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0, help="Delay added to every response.")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 502.")
+    parser.add_argument("--rate-limit", type=int, default=DEFAULT_RATE_LIMIT)
+    args = parser.parse_args()
+
+    app = create_app(args.latency_ms, args.error_rate, args.rate_limit)
+    app.run(host=args.host, port=args.port, threaded=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""Load-test the analyser against the fake GitHub API and write JSON results.
+
+Both servers run in-process on ephemeral ports, so no token or network access
+is needed. Every scenario is measured once against a cold cache and then
+repeatedly, at each concurrency level, against the warm cache.
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import json
+import os
+import platform
+import statistics
+import sys
+import threading
+import time
+
+import requests
+from werkzeug.serving import WSGIRequestHandler, make_server
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main  # noqa: E402
+from benchmarks.fake_github import create_app  # noqa: E402
+
+
+REPO_INDEPENDENT_SCENARIOS = {"user_suggestions"}
+
+
+class QuietRequestHandler(WSGIRequestHandler):
+    def log_request(self, *args, **kwargs):
+        pass
+
+
+def start_server(app):
+    server = make_server("127.0.0.1", 0, app, threaded=True, request_handler=QuietRequestHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://127.0.0.1:{server.server_port}"
+
+
+def build_scenarios(repo_count):
+    login = f"bench-{repo_count}"
+    rival = f"rival-{repo_count}"
+    return {
+        "profile": ("POST", "/", {"form_type": "profile", "username": login}),
+        "compare": (
+            "POST",
+            "/",
+            {"form_type": "compare", "compare_left_username": login, "compare_right_username": rival},
+        ),
+        "download_report": ("GET", f"/download-report/{login}", None),
+        "user_suggestions": ("GET", "/api/user-suggestions?q=bench&limit=5", None),
+    }
+
+
+def timed_request(session, base_url, method, path, form):
+    started = time.perf_counter()
+    try:
+        response = session.request(method, f"{base_url}{path}", data=form, timeout=60)
+        ok = response.status_code == 200
+    except requests.exceptions.RequestException:
+        ok = False
+    return (time.perf_counter() - started) * 1000, ok
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def run_level(base_url, scenario, concurrency, total_requests):
+    method, path, form = scenario
+    local = threading.local()
+
+    def worker(_):
+        if not hasattr(local, "session"):
+            local.session = requests.Session()
+        return timed_request(local.session, base_url, method, path, form)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(worker, range(total_requests)))
+    elapsed = time.perf_counter() - started
+
+    latencies = sorted(latency for latency, _ in results)
+    return {
+        "concurrency": concurrency,
+        "requests": total_requests,
+        "errors": sum(1 for _, ok in results if not ok),
+        "throughput_rps": round(total_requests / elapsed, 2) if elapsed else None,
+        "latency_ms": {
+            "mean": round(statistics.fmean(latencies), 3),
+            "p50": round(percentile(latencies, 0.50), 3),
+            "p95": round(percentile(latencies, 0.95), 3),
+            "p99": round(percentile(latencies, 0.99), 3),
+            "max": round(latencies[-1], 3),
+        },
+    }
+
+
+def run_benchmarks(repo_counts, concurrency_levels, requests_per_level, latency_ms, error_rate, only=None):
+    fake_server, fake_url = start_server(create_app(latency_ms=latency_ms, error_rate=error_rate, seed=0))
+    main.GITHUB_API_BASE = fake_url
+    main.CACHE_WARMER_ENABLED = False
+    app_server, app_url = start_server(main.app)
+
+    results = []
+    try:
+        for position, repo_count in enumerate(repo_counts):
+            for name, scenario in build_scenarios(repo_count).items():
+                if only and name not in only:
+                    continue
+                if position and name in REPO_INDEPENDENT_SCENARIOS:
+                    continue
+                with main._cache_lock:
+                    main._cache_store.clear()
+                with requests.Session() as session:
+                    cold_ms, cold_ok = timed_request(session, app_url, *scenario)
+                results.append(
+                    {
+                        "scenario": name,
+                        "repo_count": repo_count,
+                        "cold_ms": round(cold_ms, 3),
+                        "cold_ok": cold_ok,
+                        "levels": [
+                            run_level(app_url, scenario, concurrency, requests_per_level)
+                            for concurrency in concurrency_levels
+                        ],
+                    }
+                )
+    finally:
+        app_server.shutdown()
+        fake_server.shutdown()
+
+    return {
+        "generated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": platform.python_version(),
+        "upstream_latency_ms": latency_ms,
+        "upstream_error_rate": error_rate,
+        "results": results,
+    }
+
+
+def parse_int_list(value):
+    return [int(item) for item in value.split(",") if item.strip()]
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="Benchmark the analyser against a local fake GitHub API.")
+    parser.add_argument("--repo-counts", type=parse_int_list, default=[10, 300, 3000])
+    parser.add_argument("--concurrency", type=parse_int_list, default=[1, 4, 16])
+    parser.add_argument("--requests", type=int, default=100, help="Requests sent per concurrency level.")
+    parser.add_argument("--latency-ms", type=float, default=0, help="Delay the fake API adds to every response.")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of fake API responses that fail.")
+    parser.add_argument("--scenario", action="append", help="Only run the named scenario (repeatable).")
+    parser.add_argument("--output", help="Write JSON results here instead of stdout.")
+    args = parser.parse_args()
+
+    report = run_benchmarks(
+        args.repo_counts,
+        args.concurrency,
+        args.requests,
+        args.latency_ms,
+        args.error_rate,
+        only=set(args.scenario or []),
+    )
+    payload = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(payload + "\n")
+    else:
+        print(payload)
+
+
+if __name__ == "__main__":
+    main_cli()
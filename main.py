@@ -1,22 +1,97 @@
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
 from io import BytesIO
+import cProfile
+import gzip
+import hashlib
+import heapq
+import itertools
+import math
 import os
 import threading
 import textwrap
 import time
 import zlib
 from datetime import datetime, timezone
-from flask import Flask, render_template, request, send_file, jsonify
+from flask import Flask, Response, before_render_template, g, render_template, request, send_file, jsonify, template_rendered
 import requests
+from werkzeug.security import safe_join
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
 
 app = Flask(__name__)
 TOP_REPOS_LIMIT = 5
+REPO_PAGE_SIZE = 20
 PER_PAGE = 100
-GITHUB_API_BASE = "https://api.github.com"
+GITHUB_API_BASE = os.getenv("GITHUB_API_BASE", "https://api.github.com").rstrip("/")
 GITHUB_TOKEN = os.getenv("GITHUB_TOKEN") or os.getenv("GH_TOKEN")
 CACHE_TTL_SECONDS = int(os.getenv("CACHE_TTL_SECONDS", "900"))
+CACHE_WARMER_ENABLED = os.getenv("CACHE_WARMER_ENABLED", "1") == "1"
+CACHE_WARMER_INTERVAL_SECONDS = int(os.getenv("CACHE_WARMER_INTERVAL_SECONDS", "60"))
+CACHE_WARMER_REFRESH_AHEAD_SECONDS = int(os.getenv("CACHE_WARMER_REFRESH_AHEAD_SECONDS", "120"))
+CACHE_WARMER_HOT_USERS = int(os.getenv("CACHE_WARMER_HOT_USERS", "10"))
+CACHE_WARMER_BUDGET_SHARE = float(os.getenv("CACHE_WARMER_BUDGET_SHARE", "0.2"))
+USER_REQUEST_COUNTS_LIMIT = 1000
+REQUEST_PROFILING_ENABLED = os.getenv("REQUEST_PROFILING_ENABLED", "0") == "1"
+REQUEST_PROFILE_DIR = os.getenv("REQUEST_PROFILE_DIR", "profiles")
+STATIC_MAX_AGE_SECONDS = 365 * 24 * 3600
+COMPRESSION_MIN_BYTES = 512
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "256"))
+COMPRESSIBLE_MIMETYPES = {
+    "text/html",
+    "text/css",
+    "text/plain",
+    "text/javascript",
+    "application/javascript",
+    "application/json",
+}
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+METRIC_DEFINITIONS = {
+    "http_request_duration_seconds": ("histogram", "Time spent handling requests, by endpoint."),
+    "github_api_request_duration_seconds": ("histogram", "Latency of GitHub API calls, by route and status."),
+    "fetch_user_bundle_duration_seconds": ("histogram", "Time spent assembling a profile, repos and orgs bundle."),
+    "template_render_duration_seconds": ("histogram", "Time spent rendering Jinja templates."),
+    "pdf_build_duration_seconds": ("histogram", "Time spent building PDF reports."),
+    "cache_hits_total": ("counter", "Cache lookups served from the in-process cache."),
+    "cache_misses_total": ("counter", "Cache lookups that found no live entry."),
+    "cache_evictions_total": ("counter", "Cache entries removed because they expired."),
+    "cache_warmer_refreshes_total": ("counter", "Bundles refreshed ahead of expiry by the cache warmer."),
+    "github_rate_limit_limit": ("gauge", "Request quota reported by the last GitHub response."),
+    "github_rate_limit_remaining": ("gauge", "Requests left in the current GitHub rate-limit window."),
+    "github_rate_limit_reset_timestamp": ("gauge", "Unix time at which the GitHub rate-limit window resets."),
+}
+REPO_CARD_FIELDS = (
+    "name",
+    "private",
+    "description",
+    "language",
+    "stargazers_count",
+    "forks_count",
+    "open_issues_count",
+    "updated_at",
+    "html_url",
+)
 
 _cache_store = {}
 _cache_lock = threading.Lock()
+_cache_versions = itertools.count(1)
+_static_hashes = {}
+_rendered_pages = OrderedDict()
+_compressed_bodies = OrderedDict()
+_response_cache_lock = threading.Lock()
+_user_request_counts = Counter()
+_user_request_lock = threading.Lock()
+_cache_warmer_thread = None
+_cache_warmer_lock = threading.Lock()
+_warmer_skipped_until = {}
+_metrics_lock = threading.Lock()
+_profiler_lock = threading.Lock()
+_histograms = {}
+_counters = Counter()
+_gauges = {}
 FEATURED_USERNAMES = [
     "torvalds",
     "gaearon",
@@ -30,6 +105,98 @@ FEATURED_USERNAMES = [
 ]
 
 
+def metric_labels(labels):
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def observe_histogram(name, value, **labels):
+    key = (name, metric_labels(labels))
+    with _metrics_lock:
+        histogram = _histograms.get(key)
+        if histogram is None:
+            histogram = {"buckets": [0] * len(LATENCY_BUCKETS), "sum": 0.0, "count": 0}
+            _histograms[key] = histogram
+        for index, bound in enumerate(LATENCY_BUCKETS):
+            if value <= bound:
+                histogram["buckets"][index] += 1
+        histogram["sum"] += value
+        histogram["count"] += 1
+
+
+def increment_counter(name, amount=1, **labels):
+    with _metrics_lock:
+        _counters[(name, metric_labels(labels))] += amount
+
+
+def set_gauge(name, value, **labels):
+    with _metrics_lock:
+        _gauges[(name, metric_labels(labels))] = value
+
+
+@contextmanager
+def timed(name, **labels):
+    started = time.perf_counter()
+    try:
+        yield labels
+    finally:
+        observe_histogram(name, time.perf_counter() - started, **labels)
+
+
+def escape_label_value(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_metric_labels(labels, extra=()):
+    pairs = list(labels) + list(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{key}="{escape_label_value(value)}"' for key, value in pairs) + "}"
+
+
+def render_metrics():
+    with _metrics_lock:
+        histograms = {key: {**value, "buckets": list(value["buckets"])} for key, value in _histograms.items()}
+        counters = dict(_counters)
+        gauges = dict(_gauges)
+
+    samples = {}
+    for (name, labels), histogram in histograms.items():
+        lines = samples.setdefault(name, [])
+        for bound, count in zip(LATENCY_BUCKETS, histogram["buckets"]):
+            lines.append(f"{name}_bucket{format_metric_labels(labels, [('le', repr(bound))])} {count}")
+        lines.append(f"{name}_bucket{format_metric_labels(labels, [('le', '+Inf')])} {histogram['count']}")
+        lines.append(f"{name}_sum{format_metric_labels(labels)} {histogram['sum']}")
+        lines.append(f"{name}_count{format_metric_labels(labels)} {histogram['count']}")
+    for (name, labels), value in list(counters.items()) + list(gauges.items()):
+        samples.setdefault(name, []).append(f"{name}{format_metric_labels(labels)} {value}")
+
+    output = []
+    for name in sorted(samples):
+        metric_type, help_text = METRIC_DEFINITIONS.get(name, ("untyped", name))
+        output.append(f"# HELP {name} {help_text}")
+        output.append(f"# TYPE {name} {metric_type}")
+        output.extend(samples[name])
+    return "\n".join(output) + "\n"
+
+
+def upstream_route(path):
+    parts = path.strip("/").split("/")
+    if parts[0] == "users" and len(parts) >= 2:
+        return "/".join(["/users/{login}"] + parts[2:])
+    return "/" + "/".join(parts)
+
+
+def record_rate_limit(response):
+    for header, name in (
+        ("X-RateLimit-Limit", "github_rate_limit_limit"),
+        ("X-RateLimit-Remaining", "github_rate_limit_remaining"),
+        ("X-RateLimit-Reset", "github_rate_limit_reset_timestamp"),
+    ):
+        value = response.headers.get(header)
+        if value and value.isdigit():
+            set_gauge(name, int(value))
+
+
 def github_headers():
     headers = {"Accept": "application/vnd.github+json"}
     if GITHUB_TOKEN:
@@ -38,43 +205,78 @@ def github_headers():
 
 
 def github_get(path, params=None):
-    return requests.get(
-        f"{GITHUB_API_BASE}{path}",
-        timeout=10,
-        params=params,
-        headers=github_headers(),
-    )
+    with timed("github_api_request_duration_seconds", route=upstream_route(path), status="error") as labels:
+        response = requests.get(
+            f"{GITHUB_API_BASE}{path}",
+            timeout=10,
+            params=params,
+            headers=github_headers(),
+        )
+        labels["status"] = response.status_code
+    record_rate_limit(response)
+    return response
 
 
 def cache_get(cache_key):
+    return cache_get_entry(cache_key)[0]
+
+
+def cache_get_entry(cache_key):
     now = time.time()
+    namespace = cache_key[0]
     with _cache_lock:
         item = _cache_store.get(cache_key)
-        if not item:
-            return None
-        expires_at, value = item
-        if expires_at < now:
+        if item and item[0] < now:
             _cache_store.pop(cache_key, None)
-            return None
-        return value
+            increment_counter("cache_evictions_total", namespace=namespace)
+            item = None
+    if not item:
+        increment_counter("cache_misses_total", namespace=namespace)
+        return None, None
+    increment_counter("cache_hits_total", namespace=namespace)
+    return item[1], item[2]
 
 
 def cache_set(cache_key, value, ttl_seconds=CACHE_TTL_SECONDS):
     with _cache_lock:
-        _cache_store[cache_key] = (time.time() + ttl_seconds, value)
+        version = next(_cache_versions)
+        _cache_store[cache_key] = (time.time() + ttl_seconds, value, version)
+    return version
 
 
-def fetch_user_profile(username):
-    cache_key = ("user_profile", (username or "").lower())
-    cached = cache_get(cache_key)
-    if cached is not None:
-        return cached
+def cache_expires_at(cache_key):
+    with _cache_lock:
+        item = _cache_store.get(cache_key)
+        return item[0] if item else None
 
-    response = github_get(f"/users/{username}")
-    response.raise_for_status()
-    data = response.json()
-    cache_set(cache_key, data)
-    return data
+
+def lru_get(store, key):
+    with _response_cache_lock:
+        value = store.get(key)
+        if value is not None:
+            store.move_to_end(key)
+        return value
+
+
+def lru_set(store, key, value, max_entries=RESPONSE_CACHE_MAX_ENTRIES):
+    with _response_cache_lock:
+        store[key] = value
+        store.move_to_end(key)
+        while len(store) > max_entries:
+            store.popitem(last=False)
+
+
+def fetch_user_profile(username, force_refresh=False, versions=None):
+    cache_key = ("user_profile", (username or "").lower())
+    cached, version = (None, None) if force_refresh else cache_get_entry(cache_key)
+    if cached is None:
+        response = github_get(f"/users/{username}")
+        response.raise_for_status()
+        cached = response.json()
+        version = cache_set(cache_key, cached)
+    if versions is not None:
+        versions[cache_key] = version
+    return cached
 
 
 def fetch_user_suggestions(query, limit=5):
@@ -121,9 +323,9 @@ def fetch_user_suggestions(query, limit=5):
         ][:safe_limit]
 
 
-def fetch_all_repositories(username):
+def fetch_all_repositories(username, force_refresh=False):
     cache_key = ("user_repos", (username or "").lower())
-    cached = cache_get(cache_key)
+    cached = None if force_refresh else cache_get(cache_key)
     if cached is not None:
         return list(cached)
 
@@ -151,17 +353,55 @@ def fetch_all_repositories(username):
     return repos
 
 
-def fetch_user_orgs(username):
-    cache_key = ("user_orgs", (username or "").lower())
-    cached = cache_get(cache_key)
-    if cached is not None:
-        return list(cached)
+def repo_rank_key(repo):
+    return (
+        repo.get("stargazers_count", 0),
+        repo.get("forks_count", 0),
+        repo.get("updated_at", ""),
+    )
+
+
+def build_repo_index(repos):
+    # heapq.nlargest matches sorted(..., reverse=True)[:n], so the top slice
+    # stays consistent with the full ranking built later by ranked_repositories.
+    return {
+        "repos": repos,
+        "top": heapq.nlargest(TOP_REPOS_LIMIT, repos, key=repo_rank_key),
+        "ranked": None,
+        "total": len(repos),
+    }
+
+
+def ranked_repositories(repo_index):
+    ranked = repo_index.get("ranked")
+    if ranked is None:
+        ranked = sorted(repo_index["repos"], key=repo_rank_key, reverse=True)
+        repo_index["ranked"] = ranked
+    return ranked
+
+
+def fetch_repository_index(username, force_refresh=False, versions=None):
+    cache_key = ("user_repos_index", (username or "").lower())
+    cached, version = (None, None) if force_refresh else cache_get_entry(cache_key)
+    if cached is None:
+        cached = build_repo_index(fetch_all_repositories(username, force_refresh=force_refresh))
+        version = cache_set(cache_key, cached)
+    if versions is not None:
+        versions[cache_key] = version
+    return cached
 
-    response = github_get(f"/users/{username}/orgs")
-    response.raise_for_status()
-    data = response.json()
-    cache_set(cache_key, data)
-    return data
+
+def fetch_user_orgs(username, force_refresh=False, versions=None):
+    cache_key = ("user_orgs", (username or "").lower())
+    cached, version = (None, None) if force_refresh else cache_get_entry(cache_key)
+    if cached is None:
+        response = github_get(f"/users/{username}/orgs")
+        response.raise_for_status()
+        cached = response.json()
+        version = cache_set(cache_key, cached)
+    if versions is not None:
+        versions[cache_key] = version
+    return list(cached)
 
 
 def map_http_error(response):
@@ -178,16 +418,23 @@ def map_http_error(response):
     return f"HTTP error: {status}"
 
 
-def fetch_profile_with_orgs(username):
+def map_http_status(response):
+    status = response.status_code if response is not None else None
+    if status in (403, 404, 429):
+        return status
+    return 502
+
+
+def fetch_profile_with_orgs(username, versions=None):
     data = None
     orgs = []
     orgs_error = None
     error = None
     try:
-        data = fetch_user_profile(username)
+        data = fetch_user_profile(username, versions=versions)
 
         try:
-            orgs = fetch_user_orgs(username)
+            orgs = fetch_user_orgs(username, versions=versions)
         except requests.exceptions.RequestException as exc:
             orgs_error = f"Could not fetch organizations: {exc}"
     except requests.exceptions.Timeout:
@@ -227,172 +474,157 @@ def format_number(value):
         return str(value)
 
 
-def build_user_badges(data, orgs):
-    badges = []
+BADGE_RULES = [
+    {"feature": "site_admin", "tiers": [(1, "GitHub Staff", 3)]},
+    {"feature": "followers", "tiers": [(1000, "Popular", 3), (200, "Rising Popularity", 2)]},
+    {"feature": "public_repos", "tiers": [(100, "Repo Master", 3), (30, "Active Builder", 2)]},
+    {"feature": "orgs_count", "tiers": [(3, "Community Member", 2), (1, "Organization Member", 1)]},
+    {"feature": "public_gists", "tiers": [(10, "Knowledge Sharer", 1)]},
+    {"feature": "ratio", "tiers": [(2, "Influential", 2)], "requires": {"followers": 100}},
+    {"feature": "account_age_days", "tiers": [(365 * 5, "Veteran", 2), (365 * 2, "Established", 1)]},
+]
+
+COMPARISON_METRICS = [
+    {"label": "Followers", "feature": "followers", "weight": 4},
+    {"label": "Public Repositories", "feature": "public_repos", "weight": 3},
+    {"label": "Public Gists", "feature": "public_gists", "weight": 1},
+    {"label": "Organizations", "feature": "orgs_count", "weight": 2},
+    {"label": "Account Age (days)", "feature": "account_age_days", "weight": 2},
+    {"label": "Follower/Following Ratio", "feature": "ratio", "weight": 2, "display": "ratio"},
+    {"label": "Badge Points", "feature": "badge_points", "weight": 3},
+    {"label": "Badge Count", "feature": "badge_count", "weight": 1},
+]
+
+METRIC_DISPLAYS = {
+    "number": format_number,
+    "ratio": lambda value: f"{value:.2f}",
+}
+
+
+def compile_badge_rules(rules):
+    compiled = []
+    for rule in rules:
+        tiers = sorted(rule["tiers"], key=lambda tier: tier[0], reverse=True)
+        compiled.append(
+            (
+                rule["feature"],
+                tuple((rule.get("requires") or {}).items()),
+                tuple((threshold, {"name": name, "points": points}) for threshold, name, points in tiers),
+            )
+        )
+    return tuple(compiled)
+
+
+def compile_comparison_metrics(metrics):
+    return tuple(
+        (
+            metric["label"],
+            metric["feature"],
+            metric["weight"],
+            metric.get("higher_is_better", True),
+            METRIC_DISPLAYS[metric.get("display", "number")],
+        )
+        for metric in metrics
+    )
+
+
+_badge_rules = compile_badge_rules(BADGE_RULES)
+_comparison_metrics = compile_comparison_metrics(COMPARISON_METRICS)
+
+
+def derive_profile_features(data):
     followers = int(data.get("followers") or 0)
-    public_repos = int(data.get("public_repos") or 0)
-    public_gists = int(data.get("public_gists") or 0)
     following = int(data.get("following") or 0)
-    ratio = followers / max(following, 1)
-
     created_dt = parse_iso_datetime(data.get("created_at"))
     account_age_days = 0
     if created_dt:
         account_age_days = (datetime.now(timezone.utc) - created_dt).days
 
-    if data.get("site_admin"):
-        badges.append({"name": "GitHub Staff", "points": 3})
-    if followers >= 1000:
-        badges.append({"name": "Popular", "points": 3})
-    elif followers >= 200:
-        badges.append({"name": "Rising Popularity", "points": 2})
-    if public_repos >= 100:
-        badges.append({"name": "Repo Master", "points": 3})
-    elif public_repos >= 30:
-        badges.append({"name": "Active Builder", "points": 2})
-    if len(orgs) >= 3:
-        badges.append({"name": "Community Member", "points": 2})
-    elif len(orgs) >= 1:
-        badges.append({"name": "Organization Member", "points": 1})
-    if public_gists >= 10:
-        badges.append({"name": "Knowledge Sharer", "points": 1})
-    if ratio >= 2 and followers >= 100:
-        badges.append({"name": "Influential", "points": 2})
-    if account_age_days >= 365 * 5:
-        badges.append({"name": "Veteran", "points": 2})
-    elif account_age_days >= 365 * 2:
-        badges.append({"name": "Established", "points": 1})
-
-    points = sum(badge["points"] for badge in badges)
-    return badges, points
-
-
-def build_comparison_report(
-    left_data,
-    right_data,
-    left_orgs,
-    right_orgs,
-    left_orgs_error=None,
-    right_orgs_error=None,
-    left_badge_points=0,
-    right_badge_points=0,
-    left_badge_count=0,
-    right_badge_count=0,
-):
-    now = datetime.now(timezone.utc)
-
-    left_created = parse_iso_datetime(left_data.get("created_at"))
-    right_created = parse_iso_datetime(right_data.get("created_at"))
-
-    left_age_days = (now - left_created).days if left_created else 0
-    right_age_days = (now - right_created).days if right_created else 0
-
-    left_followers = int(left_data.get("followers") or 0)
-    right_followers = int(right_data.get("followers") or 0)
-    left_following = int(left_data.get("following") or 0)
-    right_following = int(right_data.get("following") or 0)
-
-    left_ratio = left_followers / max(left_following, 1)
-    right_ratio = right_followers / max(right_following, 1)
-
-    left_orgs_count = None if left_orgs_error else len(left_orgs)
-    right_orgs_count = None if right_orgs_error else len(right_orgs)
-
-    metrics = [
-        {
-            "label": "Followers",
-            "left": left_followers,
-            "right": right_followers,
-            "left_display": format_number(left_followers),
-            "right_display": format_number(right_followers),
-            "weight": 4,
-            "higher_is_better": True,
-        },
-        {
-            "label": "Public Repositories",
-            "left": int(left_data.get("public_repos") or 0),
-            "right": int(right_data.get("public_repos") or 0),
-            "left_display": format_number(left_data.get("public_repos") or 0),
-            "right_display": format_number(right_data.get("public_repos") or 0),
-            "weight": 3,
-            "higher_is_better": True,
-        },
-        {
-            "label": "Public Gists",
-            "left": int(left_data.get("public_gists") or 0),
-            "right": int(right_data.get("public_gists") or 0),
-            "left_display": format_number(left_data.get("public_gists") or 0),
-            "right_display": format_number(right_data.get("public_gists") or 0),
-            "weight": 1,
-            "higher_is_better": True,
-        },
-        {
-            "label": "Organizations",
-            "left": left_orgs_count,
-            "right": right_orgs_count,
-            "left_display": format_number(left_orgs_count),
-            "right_display": format_number(right_orgs_count),
-            "weight": 2,
-            "higher_is_better": True,
-            "comparable": left_orgs_count is not None and right_orgs_count is not None,
-        },
-        {
-            "label": "Account Age (days)",
-            "left": left_age_days,
-            "right": right_age_days,
-            "left_display": format_number(left_age_days),
-            "right_display": format_number(right_age_days),
-            "weight": 2,
-            "higher_is_better": True,
-        },
-        {
-            "label": "Follower/Following Ratio",
-            "left": left_ratio,
-            "right": right_ratio,
-            "left_display": f"{left_ratio:.2f}",
-            "right_display": f"{right_ratio:.2f}",
-            "weight": 2,
-            "higher_is_better": True,
-        },
-        {
-            "label": "Badge Points",
-            "left": left_badge_points,
-            "right": right_badge_points,
-            "left_display": format_number(left_badge_points),
-            "right_display": format_number(right_badge_points),
-            "weight": 3,
-            "higher_is_better": True,
-        },
-        {
-            "label": "Badge Count",
-            "left": left_badge_count,
-            "right": right_badge_count,
-            "left_display": format_number(left_badge_count),
-            "right_display": format_number(right_badge_count),
-            "weight": 1,
-            "higher_is_better": True,
-        },
-    ]
+    return {
+        "site_admin": 1 if data.get("site_admin") else 0,
+        "followers": followers,
+        "following": following,
+        "public_repos": int(data.get("public_repos") or 0),
+        "public_gists": int(data.get("public_gists") or 0),
+        "ratio": followers / max(following, 1),
+        "account_age_days": account_age_days,
+        "created_display": format_datetime(data.get("created_at")),
+        "updated_display": format_datetime(data.get("updated_at")),
+    }
+
+
+def evaluate_badges(features):
+    badges = []
+    for feature, requires, tiers in _badge_rules:
+        if any((features.get(name) or 0) < minimum for name, minimum in requires):
+            continue
+        value = features.get(feature) or 0
+        for threshold, badge in tiers:
+            if value >= threshold:
+                badges.append(badge)
+                break
+    return badges
+
+
+def evaluate_user(data, orgs, orgs_error=None):
+    orgs_count = None if orgs_error else len(orgs)
+    cache_key = ("user_evaluation", (data.get("login") or "").lower())
+    cached = cache_get(cache_key)
+    # Evaluations are tied to the exact cached profile object they were derived from.
+    if cached is not None and cached[0] is data and cached[1] == orgs_count:
+        return cached[2]
+
+    features = derive_profile_features(data)
+    features["orgs_count"] = orgs_count
+    badges = evaluate_badges(features)
+    features["badge_points"] = sum(badge["points"] for badge in badges)
+    features["badge_count"] = len(badges)
+    evaluation = {"features": features, "badges": badges, "badge_points": features["badge_points"]}
+    cache_set(cache_key, (data, orgs_count, evaluation))
+    return evaluation
+
 
+def evaluate_users(entries):
+    return [evaluate_user(data, orgs, orgs_error) for data, orgs, orgs_error in entries]
+
+
+def build_user_badges(data, orgs):
+    evaluation = evaluate_user(data, orgs)
+    return evaluation["badges"], evaluation["badge_points"]
+
+
+def build_comparison_report(left_evaluation, right_evaluation):
+    left_features = left_evaluation["features"]
+    right_features = right_evaluation["features"]
+
+    metrics = []
     left_score = 0
     right_score = 0
-    for metric in metrics:
-        if not metric.get("comparable", True):
-            metric["winner"] = "tie"
-            continue
-        left_val = metric["left"]
-        right_val = metric["right"]
-        if left_val == right_val:
+    for label, feature, weight, higher_is_better, display in _comparison_metrics:
+        left_val = left_features.get(feature)
+        right_val = right_features.get(feature)
+        metric = {
+            "label": label,
+            "left": left_val,
+            "right": right_val,
+            "left_display": display(left_val),
+            "right_display": display(right_val),
+            "weight": weight,
+            "higher_is_better": higher_is_better,
+        }
+        metrics.append(metric)
+
+        if left_val is None or right_val is None or left_val == right_val:
             metric["winner"] = "tie"
             continue
 
-        left_better = left_val > right_val if metric["higher_is_better"] else left_val < right_val
+        left_better = left_val > right_val if higher_is_better else left_val < right_val
         if left_better:
             metric["winner"] = "left"
-            left_score += metric["weight"]
+            left_score += weight
         else:
             metric["winner"] = "right"
-            right_score += metric["weight"]
+            right_score += weight
 
     if left_score > right_score:
         verdict = "left"
@@ -410,50 +642,170 @@ def build_comparison_report(
         "right_score": right_score,
         "verdict": verdict,
         "verdict_text": verdict_text,
-        "left_created_display": format_datetime(left_data.get("created_at")),
-        "right_created_display": format_datetime(right_data.get("created_at")),
-        "left_updated_display": format_datetime(left_data.get("updated_at")),
-        "right_updated_display": format_datetime(right_data.get("updated_at")),
+        "left_created_display": left_features["created_display"],
+        "right_created_display": right_features["created_display"],
+        "left_updated_display": left_features["updated_display"],
+        "right_updated_display": right_features["updated_display"],
     }
 
 
-def fetch_user_bundle(username):
+def fetch_user_bundle(username, versions=None):
     data = None
-    repos = []
+    repo_index = build_repo_index([])
     repos_error = None
     orgs = []
     orgs_error = None
     error = None
-    try:
-        data = fetch_user_profile(username)
-
+    with timed("fetch_user_bundle_duration_seconds"):
         try:
-            repos = fetch_all_repositories(username)
-            repos.sort(
-                key=lambda repo: (
-                    repo.get("stargazers_count", 0),
-                    repo.get("forks_count", 0),
-                    repo.get("updated_at", ""),
-                ),
-                reverse=True,
-            )
+            data = fetch_user_profile(username, versions=versions)
+
+            try:
+                repo_index = fetch_repository_index(username, versions=versions)
+            except requests.exceptions.RequestException as exc:
+                repos_error = f"Could not fetch repositories: {exc}"
+
+            try:
+                orgs = fetch_user_orgs(username, versions=versions)
+            except requests.exceptions.RequestException as exc:
+                orgs_error = f"Could not fetch organizations: {exc}"
+        except requests.exceptions.Timeout:
+            error = "Request timed out. Please check your internet connection and try again."
+        except requests.exceptions.ConnectionError:
+            error = "Could not connect to the internet. Please try again."
+        except requests.exceptions.HTTPError as exc:
+            error = map_http_error(exc.response)
         except requests.exceptions.RequestException as exc:
-            repos_error = f"Could not fetch repositories: {exc}"
+            error = f"Request failed: {exc}"
+
+    return data, repo_index, repos_error, orgs, orgs_error, error
+
+
+def record_user_request(username):
+    login = (username or "").strip().lower()
+    if not login:
+        return
+    with _user_request_lock:
+        _user_request_counts[login] += 1
+        if len(_user_request_counts) > USER_REQUEST_COUNTS_LIMIT:
+            kept = _user_request_counts.most_common(USER_REQUEST_COUNTS_LIMIT // 2)
+            _user_request_counts.clear()
+            _user_request_counts.update(dict(kept))
+
+
+def hot_usernames(limit=CACHE_WARMER_HOT_USERS):
+    with _user_request_lock:
+        hot = [login for login, _ in _user_request_counts.most_common(limit)]
+        # Halve every count so the hot set follows recent traffic.
+        for login in list(_user_request_counts):
+            _user_request_counts[login] //= 2
+            if not _user_request_counts[login]:
+                del _user_request_counts[login]
+    return hot
+
+
+def warm_candidates():
+    candidates = []
+    for login in hot_usernames() + [username.lower() for username in FEATURED_USERNAMES]:
+        if login not in candidates:
+            candidates.append(login)
+    return candidates
+
+
+def needs_refresh(login, now):
+    keys = [("user_profile", login), ("user_repos_index", login), ("user_orgs", login)]
+    expiries = [cache_expires_at(key) for key in keys]
+    if any(expires_at is None for expires_at in expiries):
+        return True
+    return min(expiries) - now <= CACHE_WARMER_REFRESH_AHEAD_SECONDS
+
+
+def forget_user_requests(login):
+    with _user_request_lock:
+        _user_request_counts.pop(login, None)
+
+
+def observed_rate_limit_remaining(default):
+    with _metrics_lock:
+        value = _gauges.get(("github_rate_limit_remaining", ()))
+    return default if value is None else value
+
+
+def fetch_warmer_budget():
+    response = github_get("/rate_limit")
+    response.raise_for_status()
+    core = response.json().get("resources", {}).get("core", {})
+    limit = int(core.get("limit") or 0)
+    remaining = int(core.get("remaining") or 0)
+    reset_at = int(core.get("reset") or time.time() + 3600)
+    reserved = math.ceil(limit * (1 - CACHE_WARMER_BUDGET_SHARE))
+    return remaining, reserved, reset_at
+
+
+def repo_follow_up_cost(profile):
+    # One call per repository page plus one for organizations.
+    return 1 + max(1, math.ceil(int(profile.get("public_repos") or 0) / PER_PAGE))
+
+
+def warm_cache_once():
+    try:
+        remaining, reserved, reset_at = fetch_warmer_budget()
+    except requests.exceptions.RequestException:
+        return []
 
+    warmed = []
+    now = time.time()
+    for login, skipped_until in list(_warmer_skipped_until.items()):
+        if skipped_until <= now:
+            del _warmer_skipped_until[login]
+
+    for login in warm_candidates():
+        if remaining <= reserved:
+            break
+        if login in _warmer_skipped_until or not needs_refresh(login, now):
+            continue
+        # Skip users that do not fit so one large account cannot starve the rest of the list.
+        cached_profile = cache_get(("user_profile", login))
+        if cached_profile is not None and remaining - 1 - repo_follow_up_cost(cached_profile) < reserved:
+            continue
         try:
-            orgs = fetch_user_orgs(username)
-        except requests.exceptions.RequestException as exc:
-            orgs_error = f"Could not fetch organizations: {exc}"
-    except requests.exceptions.Timeout:
-        error = "Request timed out. Please check your internet connection and try again."
-    except requests.exceptions.ConnectionError:
-        error = "Could not connect to the internet. Please try again."
-    except requests.exceptions.HTTPError as exc:
-        error = map_http_error(exc.response)
-    except requests.exceptions.RequestException as exc:
-        error = f"Request failed: {exc}"
+            profile = fetch_user_profile(login, force_refresh=True)
+            remaining = observed_rate_limit_remaining(remaining - 1)
+            follow_up_cost = repo_follow_up_cost(profile)
+            if remaining - follow_up_cost < reserved:
+                # The fresh profile is cached now, so later windows can price this user
+                # without spending a call; leave it alone for the rest of this one.
+                _warmer_skipped_until[login] = reset_at
+                continue
+            fetch_repository_index(login, force_refresh=True)
+            fetch_user_orgs(login, force_refresh=True)
+            remaining = observed_rate_limit_remaining(remaining - follow_up_cost)
+        except requests.exceptions.HTTPError as exc:
+            if exc.response is not None and exc.response.status_code == 404:
+                forget_user_requests(login)
+            continue
+        except requests.exceptions.RequestException:
+            continue
+        increment_counter("cache_warmer_refreshes_total")
+        warmed.append(login)
+    return warmed
 
-    return data, repos, repos_error, orgs, orgs_error, error
+
+def cache_warmer_loop():
+    while True:
+        warm_cache_once()
+        time.sleep(CACHE_WARMER_INTERVAL_SECONDS)
+
+
+def start_cache_warmer():
+    global _cache_warmer_thread
+    if not CACHE_WARMER_ENABLED:
+        return
+    with _cache_warmer_lock:
+        if _cache_warmer_thread is not None:
+            return
+        _cache_warmer_thread = threading.Thread(target=cache_warmer_loop, name="cache-warmer", daemon=True)
+        _cache_warmer_thread.start()
 
 
 def sanitize_pdf_text(value):
@@ -661,11 +1013,160 @@ def build_report_lines(username, data, repos, orgs):
     return blocks
 
 
+@app.before_request
+def ensure_cache_warmer():
+    # Runs in whichever process serves requests, so the reloader's watcher never starts a copy.
+    if _cache_warmer_thread is None:
+        start_cache_warmer()
+
+
+@app.before_request
+def start_request_instrumentation():
+    g.request_started = time.perf_counter()
+    # Only one cProfile.Profile may be active per process; concurrent requests run unprofiled.
+    if REQUEST_PROFILING_ENABLED and request.args.get("_profile") == "1" and _profiler_lock.acquire(blocking=False):
+        g.profiler = cProfile.Profile()
+        g.profiler.enable()
+
+
+def stop_request_profiler():
+    profiler = g.pop("profiler", None)
+    if profiler is not None:
+        profiler.disable()
+        _profiler_lock.release()
+    return profiler
+
+
+@app.after_request
+def finish_request_instrumentation(response):
+    profiler = stop_request_profiler()
+    if profiler is not None:
+        os.makedirs(REQUEST_PROFILE_DIR, exist_ok=True)
+        filename = f"{request.endpoint or 'unknown'}-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{threading.get_ident()}.prof"
+        profile_path = os.path.join(REQUEST_PROFILE_DIR, filename)
+        profiler.dump_stats(profile_path)
+        response.headers["X-Profile-File"] = profile_path
+
+    started = g.pop("request_started", None)
+    if started is not None:
+        observe_histogram(
+            "http_request_duration_seconds",
+            time.perf_counter() - started,
+            endpoint=request.endpoint or "unknown",
+            method=request.method,
+            status=response.status_code,
+        )
+    return response
+
+
+@app.teardown_request
+def release_request_profiler(exc):
+    stop_request_profiler()
+
+
+def static_file_hash(filename):
+    path = safe_join(app.static_folder, filename)
+    if path is None or not os.path.isfile(path):
+        return None
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return None
+    cached = _static_hashes.get(filename)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    with open(path, "rb") as handle:
+        digest = hashlib.sha256(handle.read()).hexdigest()[:12]
+    _static_hashes[filename] = (mtime, digest)
+    return digest
+
+
+@app.url_defaults
+def add_static_fingerprint(endpoint, values):
+    if endpoint == "static" and "filename" in values and "v" not in values:
+        digest = static_file_hash(values["filename"])
+        if digest:
+            values["v"] = digest
+
+
+def negotiate_encoding():
+    offered = ["br", "gzip"] if brotli is not None else ["gzip"]
+    return request.accept_encodings.best_match(offered)
+
+
+def compress_body(body, encoding, cacheable=False):
+    cache_key = (hashlib.sha1(body).hexdigest(), encoding) if cacheable else None
+    if cache_key is not None:
+        cached = lru_get(_compressed_bodies, cache_key)
+        if cached is not None:
+            return cached
+
+    if encoding == "br":
+        compressed = brotli.compress(body, quality=5)
+    else:
+        compressed = gzip.compress(body, compresslevel=6)
+    if cache_key is not None:
+        lru_set(_compressed_bodies, cache_key, compressed)
+    return compressed
+
+
+@app.after_request
+def compress_response(response):
+    if request.endpoint == "static" and response.status_code == 200:
+        filename = (request.view_args or {}).get("filename", "")
+        if request.args.get("v") and request.args.get("v") == static_file_hash(filename):
+            response.headers["Cache-Control"] = f"public, max-age={STATIC_MAX_AGE_SECONDS}, immutable"
+
+    if (
+        response.status_code != 200
+        or response.mimetype not in COMPRESSIBLE_MIMETYPES
+        or "Content-Encoding" in response.headers
+    ):
+        return response
+
+    response.vary.add("Accept-Encoding")
+    response.direct_passthrough = False
+    body = response.get_data()
+    encoding = negotiate_encoding() if len(body) >= COMPRESSION_MIN_BYTES else None
+
+    if request.method == "GET":
+        etag, _ = response.get_etag()
+        etag = etag or hashlib.sha1(body).hexdigest()
+        response.set_etag(f"{etag}-{encoding}" if encoding else etag)
+        response.make_conditional(request)
+        if response.status_code == 304:
+            return response
+
+    if encoding:
+        # Only bodies that repeat byte for byte (cached pages, static files) are worth keeping.
+        cacheable = request.endpoint == "static" or g.get("cacheable_response", False)
+        response.set_data(compress_body(body, encoding, cacheable))
+        response.headers["Content-Encoding"] = encoding
+    return response
+
+
+@before_render_template.connect_via(app)
+def start_template_timer(sender, template, context, **extra):
+    g.setdefault("template_timers", []).append(time.perf_counter())
+
+
+@template_rendered.connect_via(app)
+def stop_template_timer(sender, template, context, **extra):
+    timers = g.get("template_timers")
+    if timers:
+        observe_histogram(
+            "template_render_duration_seconds",
+            time.perf_counter() - timers.pop(),
+            template=template.name or "unknown",
+        )
+
+
 @app.route("/", methods=["GET", "POST"])
 def home():
     # Profile tab state
     data = None
-    repos = []
+    top_repos = []
+    repos_total = 0
     repos_error = None
     orgs = []
     orgs_error = None
@@ -693,6 +1194,11 @@ def home():
     compare_left_badge_points = 0
     compare_right_badge_points = 0
     active_tab = "profile"
+    render_key = ("empty",) if request.method == "GET" else None
+    # Cached pages embed the stylesheet's fingerprinted URL, so a changed file must miss.
+    asset_version = static_file_hash("style.css")
+    # Versions of the cache entries this page is built from, captured as they are read.
+    versions = {}
 
     if request.method == "POST":
         form_type = request.form.get("form_type", "profile").strip()
@@ -705,18 +1211,20 @@ def home():
             if not compare_left_username or not compare_right_username:
                 compare_error = "Please enter both GitHub usernames to compare."
             else:
+                record_user_request(compare_left_username)
+                record_user_request(compare_right_username)
                 (
                     compare_left_data,
                     compare_left_orgs,
                     compare_left_orgs_error,
                     left_error,
-                ) = fetch_profile_with_orgs(compare_left_username)
+                ) = fetch_profile_with_orgs(compare_left_username, versions)
                 (
                     compare_right_data,
                     compare_right_orgs,
                     compare_right_orgs_error,
                     right_error,
-                ) = fetch_profile_with_orgs(compare_right_username)
+                ) = fetch_profile_with_orgs(compare_right_username, versions)
 
                 errors = []
                 if left_error:
@@ -726,33 +1234,54 @@ def home():
                 if errors:
                     compare_error = " | ".join(errors)
                 else:
-                    compare_left_badges, compare_left_badge_points = build_user_badges(compare_left_data, compare_left_orgs)
-                    compare_right_badges, compare_right_badge_points = build_user_badges(compare_right_data, compare_right_orgs)
-                    compare_report = build_comparison_report(
-                        compare_left_data,
-                        compare_right_data,
-                        compare_left_orgs,
-                        compare_right_orgs,
-                        compare_left_orgs_error,
-                        compare_right_orgs_error,
-                        compare_left_badge_points,
-                        compare_right_badge_points,
-                        len(compare_left_badges),
-                        len(compare_right_badges),
+                    left_evaluation, right_evaluation = evaluate_users(
+                        [
+                            (compare_left_data, compare_left_orgs, compare_left_orgs_error),
+                            (compare_right_data, compare_right_orgs, compare_right_orgs_error),
+                        ]
                     )
+                    compare_left_badges = left_evaluation["badges"]
+                    compare_left_badge_points = left_evaluation["badge_points"]
+                    compare_right_badges = right_evaluation["badges"]
+                    compare_right_badge_points = right_evaluation["badge_points"]
+                    compare_report = build_comparison_report(left_evaluation, right_evaluation)
+                    if not compare_left_orgs_error and not compare_right_orgs_error:
+                        render_key = (
+                            "compare",
+                            compare_left_username,
+                            compare_right_username,
+                            tuple(sorted(versions.items())),
+                        )
         else:
             username = request.form.get("username", "").strip()
             if not username:
                 error = "Please enter a GitHub username."
             else:
-                data, repos, repos_error, orgs, orgs_error, error = fetch_user_bundle(username)
+                record_user_request(username)
+                data, repo_index, repos_error, orgs, orgs_error, error = fetch_user_bundle(username, versions)
+                top_repos = repo_index["top"]
+                repos_total = repo_index["total"]
                 if data and not error:
                     profile_badges, profile_badge_points = build_user_badges(data, orgs)
-
-    return render_template(
+                    if not repos_error and not orgs_error:
+                        render_key = (
+                            "profile",
+                            username,
+                            tuple(sorted(versions.items())),
+                        )
+
+    if render_key is not None:
+        render_key = render_key + (asset_version,)
+        g.cacheable_response = True
+        cached = lru_get(_rendered_pages, render_key)
+        if cached is not None:
+            return cached
+
+    html = render_template(
         "index.html",
         data=data,
-        repos=repos,
+        repos=top_repos,
+        repos_total=repos_total,
         repos_error=repos_error,
         orgs=orgs,
         orgs_error=orgs_error,
@@ -764,6 +1293,7 @@ def home():
         activity_chart_data=activity_chart_data,
         activity_chart_error=activity_chart_error,
         top_repos_limit=TOP_REPOS_LIMIT,
+        repo_page_size=REPO_PAGE_SIZE,
         active_tab=active_tab,
         compare_left_username=compare_left_username,
         compare_right_username=compare_right_username,
@@ -780,6 +1310,9 @@ def home():
         compare_left_badge_points=compare_left_badge_points,
         compare_right_badge_points=compare_right_badge_points,
     )
+    if render_key is not None:
+        lru_set(_rendered_pages, render_key, html)
+    return html
 
 
 @app.route("/download-report/<username>")
@@ -788,13 +1321,15 @@ def download_pdf_report(username):
     if not username:
         return "Username is required.", 400
 
-    data, repos, _, orgs, _, error = fetch_user_bundle(username)
+    record_user_request(username)
+    data, repo_index, _, orgs, _, error = fetch_user_bundle(username)
     if error or not data:
         message = error or "User not found."
         return message, 404
 
-    blocks = build_report_lines(username, data, repos, orgs)
-    pdf_bytes = build_simple_pdf(username, blocks)
+    blocks = build_report_lines(username, data, ranked_repositories(repo_index), orgs)
+    with timed("pdf_build_duration_seconds"):
+        pdf_bytes = build_simple_pdf(username, blocks)
     filename = f"github-report-{username}.pdf"
     return send_file(
         BytesIO(pdf_bytes),
@@ -804,6 +1339,77 @@ def download_pdf_report(username):
     )
 
 
+def parse_repo_page_args():
+    try:
+        offset = max(0, int(request.args.get("offset", 0)))
+    except (TypeError, ValueError):
+        offset = 0
+    try:
+        limit = max(1, min(int(request.args.get("limit", REPO_PAGE_SIZE)), PER_PAGE))
+    except (TypeError, ValueError):
+        limit = REPO_PAGE_SIZE
+    return offset, limit
+
+
+def repository_page(repo_index, offset, limit):
+    if offset + limit <= TOP_REPOS_LIMIT:
+        items = repo_index["top"][offset:offset + limit]
+    else:
+        items = ranked_repositories(repo_index)[offset:offset + limit]
+    next_offset = offset + len(items)
+    return {
+        "items": items,
+        "offset": offset,
+        "limit": limit,
+        "total": repo_index["total"],
+        "next_offset": next_offset if next_offset < repo_index["total"] else None,
+    }
+
+
+def fetch_repository_page(username):
+    username = (username or "").strip()
+    if not username:
+        return None, ("Username is required.", 400)
+
+    offset, limit = parse_repo_page_args()
+    try:
+        repo_index = fetch_repository_index(username)
+    except requests.exceptions.HTTPError as exc:
+        return None, (map_http_error(exc.response), map_http_status(exc.response))
+    except requests.exceptions.RequestException as exc:
+        return None, (f"Could not fetch repositories: {exc}", 502)
+    return repository_page(repo_index, offset, limit), None
+
+
+@app.route("/repos/<username>")
+def repo_cards_fragment(username):
+    page, failure = fetch_repository_page(username)
+    if failure:
+        return failure
+
+    response = app.make_response(render_template("repo_cards.html", repos=page["items"]))
+    response.headers["X-Total-Count"] = str(page["total"])
+    if page["next_offset"] is not None:
+        response.headers["X-Next-Offset"] = str(page["next_offset"])
+    return response
+
+
+@app.route("/api/repos/<username>")
+def repo_page_json(username):
+    page, failure = fetch_repository_page(username)
+    if failure:
+        message, status = failure
+        return jsonify({"error": message, "status": status}), status
+
+    page["items"] = [{field: repo.get(field) for field in REPO_CARD_FIELDS} for repo in page["items"]]
+    return jsonify(page)
+
+
+@app.route("/metrics")
+def metrics():
+    return Response(render_metrics(), mimetype="text/plain; version=0.0.4")
+
+
 @app.route("/api/user-suggestions")
 def user_suggestions():
     query = request.args.get("q", "")
@@ -817,4 +1423,8 @@ def user_suggestions():
 
 
 if __name__ == "__main__":
+    # The debug reloader runs this block in a watcher process too; only the serving child
+    # warms the cache up front, other servers start it on the first request.
+    if os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+        start_cache_warmer()
     app.run(debug=True)